@@ -1,30 +1,157 @@
 # app/analyzer.py
 import numpy as np
-from sklearn.ensemble import IsolationForest, RandomForestClassifier
+from sklearn.ensemble import IsolationForest
 from sklearn.preprocessing import StandardScaler
 import logging
 from collections import deque
 import time
 from datetime import datetime
+from functools import lru_cache
 import os
+from app.jit import njit, NUMBA_AVAILABLE
+
+# Set once the analyzer log handler is attached, shared by all instances
+_LOGGER_READY = False
+
+# Offset from the monotonic clock to wall-clock time, used for display only
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _isoformat(ts_ns):
+    """Wall-clock ISO timestamp for a time.monotonic_ns() reading"""
+    return datetime.fromtimestamp((ts_ns + _WALL_OFFSET_NS) / 1e9).isoformat()
+
+
+@lru_cache(maxsize=None)
+def _trend_basis(n):
+    """Centered sample positions and their sum of squares for an n-point fit"""
+    x = np.arange(n, dtype=np.float64)
+    x_centered = x - x.mean()
+    return x_centered, float(x_centered @ x_centered)
+
+
+@njit(cache=True)
+def _periodicity(values):
+    """Count direction changes in one pass; periodic when above 40%"""
+    prev_sign = 0
+    changes = 0
+    for i in range(1, values.size):
+        sign = 1 if values[i] - values[i - 1] >= 0 else -1
+        if prev_sign != 0 and sign != prev_sign:
+            changes += 1
+        prev_sign = sign
+    return changes > values.size * 0.4
+
+
+@njit(cache=True)
+def _window_stats_loop(values):
+    """Per-row mean, std, min and max of a 2D array in one traversal"""
+    rows, n = values.shape
+    stats = np.empty((rows, 4))
+    for r in range(rows):
+        # Welford's running mean/variance alongside running min/max
+        mean = 0.0
+        m2 = 0.0
+        low = values[r, 0]
+        high = values[r, 0]
+        for i in range(n):
+            v = values[r, i]
+            delta = v - mean
+            mean += delta / (i + 1)
+            m2 += delta * (v - mean)
+            if v < low:
+                low = v
+            if v > high:
+                high = v
+        stats[r, 0] = mean
+        stats[r, 1] = np.sqrt(m2 / n)
+        stats[r, 2] = low
+        stats[r, 3] = high
+    return stats
+
+
+def _window_stats_numpy(values):
+    """Per-row mean, std, min and max of a 2D array"""
+    return np.stack((
+        values.mean(axis=1),
+        values.std(axis=1),
+        values.min(axis=1),
+        values.max(axis=1)
+    ), axis=1)
+
+
+# The loop only pays off once compiled; plain NumPy reductions are faster
+# than interpreting it
+_window_stats = _window_stats_loop if NUMBA_AVAILABLE else _window_stats_numpy
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) at import rather than on the first sample
+    _periodicity(np.zeros(4, dtype=np.float32))
+    _window_stats(np.zeros((3, 4), dtype=np.float32))
+
+
+def _metrics_key(metrics):
+    """Cache key for a sample: cpu/memory/disk at 0.1% resolution"""
+    return (
+        round(metrics['cpu_usage'], 1),
+        round(metrics['memory_usage'], 1),
+        round(metrics['disk_usage'], 1)
+    )
+
+
+@lru_cache(maxsize=512)
+def _prepare_features_impl(cpu, memory, disk):
+    """Build the feature row for a (rounded) sample"""
+    # float32 end to end: percentages need no more precision, and
+    # IsolationForest validates its input as float32 anyway
+    values = np.array([cpu, memory, disk], dtype=np.float32)
+    features = np.empty(6, dtype=np.float32)
+    features[:3] = values
+    
+    # Add derived features
+    features[3] = cpu / max(memory, 1.0)  # CPU/Memory ratio
+    features[4] = values.mean()  # Average load
+    features[5] = values.std()  # Resource balance
+    
+    return features[None, :]
+
 
 class SystemAnalyzer:
+    # Health weights for cpu, memory and disk usage
+    _W = np.array([0.4, 0.3, 0.3], dtype=np.float32)
+    
+    # Prebuilt resource insights keyed by (component, bucket), where bucket 1
+    # is above the warning threshold and bucket 2 above the critical one
+    _RESOURCES = ('cpu', 'memory', 'disk')
+    _INSIGHT_TABLE = {
+        ('cpu', 1): {'type': 'warning', 'component': 'cpu', 'message': 'High CPU usage detected'},
+        ('cpu', 2): {'type': 'critical', 'component': 'cpu', 'message': 'Critical CPU usage detected'},
+        ('memory', 1): {'type': 'warning', 'component': 'memory', 'message': 'High memory usage detected'},
+        ('memory', 2): {'type': 'critical', 'component': 'memory', 'message': 'Critical memory usage detected'},
+        ('disk', 1): {'type': 'warning', 'component': 'disk', 'message': 'High disk usage detected'},
+        ('disk', 2): {'type': 'critical', 'component': 'disk', 'message': 'Critical disk usage detected'}
+    }
+
     def __init__(self):
-        # Initialize ML components
-        self.anomaly_detector = IsolationForest(
-            contamination=0.1,
-            random_state=42
-        )
-        self.pattern_classifier = RandomForestClassifier(
-            n_estimators=100,
-            random_state=42
-        )
+        # Initialize ML components (the forest is built on the first refit)
+        self.anomaly_detector = None
         self.scaler = StandardScaler()
         
-        # Data management
-        self.metrics_history = deque(maxlen=100)
+        # Data management: cpu/memory/disk rows in a fixed ring buffer
+        self.history_size = 100
+        self._buf = np.zeros((3, self.history_size), dtype=np.float32)
+        self._head = 0
+        self._count = 0
+        self.feature_history = deque(maxlen=self.history_size)
         self.analysis_history = deque(maxlen=50)
         
+        # Model refresh: refit on the feature window every N samples and
+        # only score the newest row in between
+        self.refit_interval = 50
+        self._if_fit_counter = 0
+        self._scaler_fitted = False
+        
         # Analysis windows
         self.short_window = 5    # Last 5 readings
         self.medium_window = 15  # Last 15 readings
@@ -33,40 +160,117 @@ class SystemAnalyzer:
         # Thresholds
         self.critical_threshold = 90.0
         self.warning_threshold = 70.0
+        self._insight_thresholds = np.array([
+            self.warning_threshold,
+            self.critical_threshold
+        ])
         
         # Setup logging
         self._setup_logging()
 
     def _setup_logging(self):
         """Initialize logging configuration"""
+        global _LOGGER_READY
+        self.logger = logging.getLogger('SystemAnalyzer')
+        if _LOGGER_READY:
+            return
+            
         try:
-            if not os.path.exists('logs'):
-                os.makedirs('logs')
-                
-            logging.basicConfig(
-                filename='logs/analyzer.log',
-                level=logging.INFO,
-                format='%(asctime)s - %(levelname)s - %(message)s'
-            )
-            self.logger = logging.getLogger('SystemAnalyzer')
+            os.makedirs('logs', exist_ok=True)
+            
+            # Dedicated handler instead of basicConfig, so the root logger
+            # is left alone and repeated instances add nothing
+            handler = logging.FileHandler('logs/analyzer.log')
+            handler.setFormatter(logging.Formatter(
+                '%(asctime)s - %(levelname)s - %(message)s'
+            ))
+            self.logger.addHandler(handler)
+            self.logger.setLevel(logging.INFO)
+            _LOGGER_READY = True
         except Exception as e:
             print(f"Error setting up logging: {e}")
 
     def analyze_metrics(self, metrics, predictions, optimizations):
         """Analyze system metrics and generate insights"""
         try:
-            # Store metrics
-            self.metrics_history.append(metrics)
-            
             # Prepare analysis components
             features = self._prepare_features(metrics)
             if features is None:
                 return self._generate_default_analysis()
             
+            # Store metrics and periodically refit the anomaly model
+            if self._record_metrics(metrics, features[0]):
+                self._fit_anomaly_detector()
+            
             # Perform analysis
+            views = self._build_views()
             anomaly_score = self._detect_anomalies(features)
-            patterns = self._detect_patterns()
-            trends = self._analyze_trends()
+            
+            return self._build_analysis(
+                metrics,
+                predictions,
+                optimizations,
+                anomaly_score,
+                self._detect_patterns(views),
+                self._analyze_trends(views)
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error in metric analysis: {e}")
+            return self._generate_default_analysis()
+
+    def analyze_metrics_batch(self, metrics_batch, predictions=None, optimizations=None):
+        """Analyze a backlog of samples with bulk anomaly scoring
+        
+        Rows are scored with one transform/predict call per model refit
+        instead of one per sample. Patterns and trends describe the window
+        at the end of the batch and are shared by every result.
+        """
+        batch = list(metrics_batch)
+        try:
+            rows = [self._prepare_features(metrics) for metrics in batch]
+            accepted = [i for i, row in enumerate(rows) if row is not None]
+            if not accepted:
+                return [self._generate_default_analysis() for _ in batch]
+                
+            features = np.vstack([rows[i] for i in accepted])
+            scores = np.empty(len(accepted))
+            
+            # Score pending rows with the current model before each refit,
+            # matching what sequential analyze_metrics calls would produce
+            start = 0
+            for j, i in enumerate(accepted):
+                if self._record_metrics(batch[i], features[j]):
+                    if j > start:
+                        scores[start:j] = self._score_anomalies(features[start:j])
+                    self._fit_anomaly_detector()
+                    start = j
+            scores[start:] = self._score_anomalies(features[start:])
+            
+            views = self._build_views()
+            patterns = self._detect_patterns(views)
+            trends = self._analyze_trends(views)
+            
+            results = [self._generate_default_analysis() if row is None else None for row in rows]
+            for j, i in enumerate(accepted):
+                results[i] = self._build_analysis(
+                    batch[i],
+                    predictions,
+                    optimizations,
+                    float(scores[j]),
+                    patterns,
+                    trends
+                )
+                
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error in batch metric analysis: {e}")
+            return [self._generate_default_analysis() for _ in batch]
+
+    def _build_analysis(self, metrics, predictions, optimizations, anomaly_score, patterns, trends):
+        """Assemble and store the analysis result for one sample"""
+        try:
             insights = self._generate_insights(
                 metrics, 
                 predictions, 
@@ -83,7 +287,7 @@ class SystemAnalyzer:
             
             # Generate analysis result
             analysis = {
-                'timestamp': datetime.now().isoformat(),
+                'ts_ns': time.monotonic_ns(),
                 'metrics': metrics,
                 'health_indicators': health_indicators,
                 'anomaly_score': float(anomaly_score),
@@ -99,43 +303,92 @@ class SystemAnalyzer:
             return analysis
             
         except Exception as e:
-            self.logger.error(f"Error in metric analysis: {e}")
+            self.logger.error(f"Error building analysis: {e}")
             return self._generate_default_analysis()
 
+    def _record_metrics(self, metrics, features):
+        """Store a sample; return True when the anomaly model is due a refit"""
+        self._buf[:, self._head] = (
+            metrics['cpu_usage'],
+            metrics['memory_usage'],
+            metrics['disk_usage']
+        )
+        self._head = (self._head + 1) % self.history_size
+        self._count = min(self._count + 1, self.history_size)
+        
+        self.feature_history.append(features)
+        self._if_fit_counter += 1
+        return self._if_fit_counter % self.refit_interval == 0
+
+    def _window(self, n):
+        """Return the last n samples as a (3, n) array, oldest first"""
+        n = min(n, self._count)
+        start = self._head - n
+        if start >= 0:
+            return self._buf[:, start:self._head]
+        
+        # Window wraps around the end of the buffer
+        return np.concatenate(
+            (self._buf[:, start:], self._buf[:, :self._head]),
+            axis=1
+        )
+
+    def _build_views(self):
+        """Slice the analysis windows once per sample"""
+        history = self._window(self._count)
+        return {
+            'short_term': history[:, -self.short_window:],
+            'medium_term': history[:, -self.medium_window:],
+            'long_term': history[:, -self.long_window:],
+            'history': history
+        }
+
     def _prepare_features(self, metrics):
         """Prepare features for analysis"""
         try:
-            features = [
-                metrics['cpu_usage'],
-                metrics['memory_usage'],
-                metrics['disk_usage']
-            ]
-            
-            # Add derived features
-            features.extend([
-                metrics['cpu_usage'] / max(metrics['memory_usage'], 1),  # CPU/Memory ratio
-                sum([metrics['cpu_usage'], 
-                     metrics['memory_usage'], 
-                     metrics['disk_usage']]) / 3,  # Average load
-                np.std([metrics['cpu_usage'], 
-                       metrics['memory_usage'], 
-                       metrics['disk_usage']])  # Resource balance
-            ])
-            
-            return np.array(features).reshape(1, -1)
+            # Neighbouring samples usually repeat at 0.1% resolution, so the
+            # row is cached; copy it so callers never alias the cache entry
+            return _prepare_features_impl(*_metrics_key(metrics)).copy()
             
         except Exception as e:
             self.logger.error(f"Error preparing features: {e}")
             return None
 
+    def _fit_anomaly_detector(self):
+        """Fit the scaler and anomaly detector on the feature window"""
+        try:
+            if self.anomaly_detector is None:
+                # 50 trees are plenty for 6 features and at most 100 rows
+                self.anomaly_detector = IsolationForest(
+                    n_estimators=50,
+                    contamination=0.1,
+                    random_state=42
+                )
+            
+            window = np.vstack(self.feature_history)
+            self.scaler.fit(window)
+            self.anomaly_detector.fit(self.scaler.transform(window))
+            self._scaler_fitted = True
+            
+        except Exception as e:
+            self.logger.error(f"Error fitting anomaly detector: {e}")
+
+    def _score_anomalies(self, features):
+        """Label each feature row 1 (normal) or -1 (anomaly)"""
+        # No model until the first refit; treat behavior as normal
+        if not self._scaler_fitted:
+            return np.ones(len(features))
+        
+        # Scale features
+        scaled_features = self.scaler.transform(features)
+        
+        # Detect anomalies (tree walk only, the model is already fitted)
+        return self.anomaly_detector.predict(scaled_features)
+
     def _detect_anomalies(self, features):
         """Detect system anomalies"""
         try:
-            # Scale features
-            scaled_features = self.scaler.fit_transform(features)
-            
-            # Detect anomalies
-            score = self.anomaly_detector.fit_predict(scaled_features)[0]
+            score = self._score_anomalies(features)[0]
             
             # Convert to normalized score (-1 to 1)
             return float(score)
@@ -144,16 +397,16 @@ class SystemAnalyzer:
             self.logger.error(f"Error detecting anomalies: {e}")
             return 0.0
 
-    def _detect_patterns(self):
+    def _detect_patterns(self, views):
         """Detect system behavior patterns"""
         try:
-            if len(self.metrics_history) < self.short_window:
+            if views['history'].shape[1] < self.short_window:
                 return {}
                 
             patterns = {
-                'cyclic_load': self._detect_cyclic_patterns(),
-                'resource_correlation': self._analyze_resource_correlation(),
-                'usage_patterns': self._analyze_usage_patterns()
+                'cyclic_load': self._detect_cyclic_patterns(views['medium_term']),
+                'resource_correlation': self._analyze_resource_correlation(views['short_term']),
+                'usage_patterns': self._analyze_usage_patterns(views['history'])
             }
             
             return patterns
@@ -162,10 +415,10 @@ class SystemAnalyzer:
             self.logger.error(f"Error detecting patterns: {e}")
             return {}
 
-    def _analyze_trends(self):
+    def _analyze_trends(self, views):
         """Analyze system metric trends"""
         try:
-            if len(self.metrics_history) < 2:
+            if views['history'].shape[1] < 2:
                 return self._generate_default_trends()
                 
             trends = {}
@@ -174,12 +427,13 @@ class SystemAnalyzer:
                 ('medium_term', self.medium_window),
                 ('long_term', self.long_window)
             ]:
-                if len(self.metrics_history) >= window_size:
-                    window_data = list(self.metrics_history)[-window_size:]
+                window_data = views[window_name]
+                if window_data.shape[1] >= window_size:
+                    slopes = self._calculate_trends_batch(window_data)
                     trends[window_name] = {
-                        'cpu': self._calculate_trend([m['cpu_usage'] for m in window_data]),
-                        'memory': self._calculate_trend([m['memory_usage'] for m in window_data]),
-                        'disk': self._calculate_trend([m['disk_usage'] for m in window_data])
+                        'cpu': float(slopes[0]),
+                        'memory': float(slopes[1]),
+                        'disk': float(slopes[2])
                     }
                     
             return trends
@@ -188,59 +442,37 @@ class SystemAnalyzer:
             self.logger.error(f"Error analyzing trends: {e}")
             return self._generate_default_trends()
 
-    def _calculate_trend(self, values):
-        """Calculate trend for a series of values"""
+    def _calculate_trends_batch(self, values):
+        """Calculate the linear trend of each row of a (k, n) array"""
         try:
-            if not values or len(values) < 2:
-                return 0.0
+            if values.shape[1] < 2:
+                return np.zeros(values.shape[0])
                 
-            x = np.arange(len(values))
-            y = np.array(values)
-            
-            # Calculate linear trend
-            coefficients = np.polyfit(x, y, 1)
-            slope = coefficients[0]
-            
-            return float(slope)
+            # Least-squares slope: cov(x, y) / var(x). The positions are
+            # centered, so y needs no centering and one matmul covers all rows
+            x_centered, x_var_sum = _trend_basis(values.shape[1])
+            return (values @ x_centered) / x_var_sum
             
         except Exception as e:
             self.logger.error(f"Error calculating trend: {e}")
-            return 0.0
+            return np.zeros(values.shape[0])
 
     def _generate_insights(self, metrics, predictions, optimizations, anomaly_score):
         """Generate system insights"""
         try:
-            insights = []
-            
-            # Resource usage insights
-            if metrics['cpu_usage'] > self.critical_threshold:
-                insights.append({
-                    'type': 'critical',
-                    'component': 'cpu',
-                    'message': 'Critical CPU usage detected'
-                })
-            elif metrics['cpu_usage'] > self.warning_threshold:
-                insights.append({
-                    'type': 'warning',
-                    'component': 'cpu',
-                    'message': 'High CPU usage detected'
-                })
-                
-            # Similar checks for memory and disk
-            for resource in ['memory', 'disk']:
-                usage = metrics[f'{resource}_usage']
-                if usage > self.critical_threshold:
-                    insights.append({
-                        'type': 'critical',
-                        'component': resource,
-                        'message': f'Critical {resource} usage detected'
-                    })
-                elif usage > self.warning_threshold:
-                    insights.append({
-                        'type': 'warning',
-                        'component': resource,
-                        'message': f'High {resource} usage detected'
-                    })
+            # Resource usage insights: side='left' keeps the thresholds
+            # strict, so a value equal to a threshold stays in the lower bucket
+            usage = np.array([
+                metrics['cpu_usage'],
+                metrics['memory_usage'],
+                metrics['disk_usage']
+            ])
+            buckets = np.searchsorted(self._insight_thresholds, usage, side='left')
+            insights = [
+                self._INSIGHT_TABLE[(resource, bucket)]
+                for resource, bucket in zip(self._RESOURCES, buckets.tolist())
+                if bucket
+            ]
             
             # Anomaly insights
             if anomaly_score == -1:
@@ -268,14 +500,14 @@ class SystemAnalyzer:
         """Calculate system health indicators"""
         try:
             # Base health score
-            base_health = 100.0 - (
-                0.4 * metrics['cpu_usage'] +
-                0.3 * metrics['memory_usage'] +
-                0.3 * metrics['disk_usage']
+            values = np.array(
+                (metrics['cpu_usage'], metrics['memory_usage'], metrics['disk_usage']),
+                dtype=np.float32
             )
+            base_health = 100.0 - float(self._W @ values)
             
-            # Adjust for anomalies
-            anomaly_factor = 1.0 if anomaly_score == 1 else 0.8
+            # Adjust for anomalies (branchless: 1.0 when normal, else 0.8)
+            anomaly_factor = 0.8 + 0.2 * (anomaly_score == 1)
             
             # Adjust for predictions
             prediction_factor = 1.0
@@ -286,7 +518,7 @@ class SystemAnalyzer:
             health_score = base_health * anomaly_factor * prediction_factor
             
             return {
-                'overall_health': max(0.0, min(100.0, health_score)),
+                'overall_health': float(np.clip(health_score, 0.0, 100.0)),
                 'resource_health': {
                     'cpu': 100.0 - metrics['cpu_usage'],
                     'memory': 100.0 - metrics['memory_usage'],
@@ -316,17 +548,15 @@ class SystemAnalyzer:
             self.logger.error(f"Error determining status: {e}")
             return 'unknown'
 
-    def _detect_cyclic_patterns(self):
+    def _detect_cyclic_patterns(self, recent_data):
         """Detect cyclic load patterns"""
         try:
-            if len(self.metrics_history) < self.medium_window:
+            if recent_data.shape[1] < self.medium_window:
                 return {}
                 
-            recent_data = list(self.metrics_history)[-self.medium_window:]
-            
+
             patterns = {}
-            for metric in ['cpu_usage', 'memory_usage', 'disk_usage']:
-                values = [m[metric] for m in recent_data]
+            for metric, values in zip(['cpu_usage', 'memory_usage', 'disk_usage'], recent_data):
                 patterns[metric] = {
                     'periodic': self._check_periodicity(values),
                     'variance': float(np.var(values))
@@ -338,22 +568,19 @@ class SystemAnalyzer:
             self.logger.error(f"Error detecting cyclic patterns: {e}")
             return {}
 
-    def _analyze_resource_correlation(self):
+    def _analyze_resource_correlation(self, recent_data):
         """Analyze correlation between resources"""
         try:
-            if len(self.metrics_history) < self.short_window:
+            if recent_data.shape[1] < self.short_window:
                 return {}
                 
-            recent_data = list(self.metrics_history)[-self.short_window:]
-            
-            cpu_values = [m['cpu_usage'] for m in recent_data]
-            memory_values = [m['memory_usage'] for m in recent_data]
-            disk_values = [m['disk_usage'] for m in recent_data]
+            # One 3x3 correlation matrix instead of three pairwise calls
+            matrix = np.corrcoef(recent_data)
             
             correlations = {
-                'cpu_memory': float(np.corrcoef(cpu_values, memory_values)[0, 1]),
-                'cpu_disk': float(np.corrcoef(cpu_values, disk_values)[0, 1]),
-                'memory_disk': float(np.corrcoef(memory_values, disk_values)[0, 1])
+                'cpu_memory': float(matrix[0, 1]),
+                'cpu_disk': float(matrix[0, 2]),
+                'memory_disk': float(matrix[1, 2])
             }
             
             return correlations
@@ -362,20 +589,22 @@ class SystemAnalyzer:
             self.logger.error(f"Error analyzing resource correlation: {e}")
             return {}
 
-    def _analyze_usage_patterns(self):
+    def _analyze_usage_patterns(self, values):
         """Analyze resource usage patterns"""
         try:
-            if len(self.metrics_history) < self.medium_window:
+            if values.shape[1] < self.medium_window:
                 return {}
                 
+            stats = _window_stats(values)
+            
             patterns = {}
-            for metric in ['cpu_usage', 'memory_usage', 'disk_usage']:
-                values = [m[metric] for m in self.metrics_history]
+            for i, metric in enumerate(['cpu_usage', 'memory_usage', 'disk_usage']):
+                mean, std, low, high = stats[i]
                 patterns[metric] = {
-                    'mean': float(np.mean(values)),
-                    'std': float(np.std(values)),
-                    'min': float(np.min(values)),
-                    'max': float(np.max(values))
+                    'mean': float(mean),
+                    'std': float(std),
+                    'min': float(low),
+                    'max': float(high)
                 }
                 
             return patterns
@@ -391,10 +620,7 @@ class SystemAnalyzer:
                 return False
                 
             # Simple periodicity check
-            diffs = np.diff(values)
-            sign_changes = np.diff(np.signbit(diffs))
-            
-            return bool(np.sum(sign_changes) > len(values) * 0.4)
+            return bool(_periodicity(values))
             
         except Exception as e:
             self.logger.error(f"Error checking periodicity: {e}")
@@ -403,7 +629,7 @@ class SystemAnalyzer:
     def _generate_default_analysis(self):
         """Generate default analysis result"""
         return {
-            'timestamp': datetime.now().isoformat(),
+            'ts_ns': time.monotonic_ns(),
             'metrics': {},
             'health_indicators': self._generate_default_health_indicators(),
             'anomaly_score': 0.0,
@@ -442,6 +668,7 @@ class SystemAnalyzer:
                 
             latest = self.analysis_history[-1]
             return {
+                'timestamp': _isoformat(latest['ts_ns']),
                 'current_status': latest['status'],
                 'health_score': latest['health_indicators']['overall_health'],
                 'anomalies_detected': latest['anomaly_score'] == -1,
@@ -1,85 +1,158 @@
 # app/fault_injector.py
+import gc
 import random
+import asyncio
 import threading
+import multiprocessing
 import time
 import numpy as np
 import logging
 import os
 from datetime import datetime
 import psutil
+from collections import deque
+from concurrent.futures import wait as wait_futures
 from sklearn.preprocessing import StandardScaler
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Awaitable, Callable, NamedTuple
+
+def _cpu_burn(end_time: float):
+    """Keep one core busy with BLAS matrix multiplies until end_time"""
+    a = np.random.rand(512, 512)
+    b = np.random.rand(512, 512)
+    c = np.empty((512, 512))
+    while time.time() < end_time:
+        np.dot(a, b, out=c)
+
+class FaultConfig(NamedTuple):
+    """Static behaviour of one fault type"""
+    simulate: Callable[[], bool]
+    recovery: Callable[[int], Awaitable[bool]]
+    impact_factor: float
+    recovery_steps: int
+    metrics_affected: tuple
+    cooldown: int
+    max_duration: int
+    cascade_probability: float
 
 class FaultInjector:
+    # Zero-filled 1MB block written by the disk and I/O simulations
+    _MB_BUF = bytes(1024 * 1024)
+    
     def __init__(self):
-        # Core components
+        # Core components; active_faults is copy-on-write so readers can
+        # take a snapshot without the lock
         self.active_faults = {}
         self.recovery_actions = []
-        self._lock = threading.Lock()
+        self._faults_lock = threading.RLock()  # active_faults and stop events
+        self._stats_lock = threading.Lock()  # fault_success_rate
         self.recovery_in_progress = False
         
+        # All recoveries run as tasks on one background event loop
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        self._recoveries = set()
+        self._closed = False  # set by cleanup; no faults are accepted after
+        
+        # Per-fault stop signals for running recoveries
+        self._stop_events = {}
+        
+        # System state snapshot shared by all recovery threads
+        self._state_cache = (0.0, None)
+        self._state_lock = threading.Lock()
+        self.state_ttl = 1.0  # seconds
+        
         # ML components
         self.scaler = StandardScaler()
-        self.fault_history = []
-        self.recovery_history = []
         self.max_history = 100
+        self.fault_history = deque(maxlen=self.max_history)
+        self.recovery_history = deque(maxlen=self.max_history)
         
         # Fault tracking
         self.last_fault_time = {}
         self.fault_success_rate = {}
+        self._stats_version = 0
+        self._success_rates_cache = (-1, {})
         
         # Setup logging
         self._setup_logging()
         
         # Initialize fault configurations
         self.fault_types = {
-            'cpu_overload': {
-                'simulate': self._simulate_cpu_overload,
-                'recovery': self._recover_cpu_overload,
-                'impact_factor': 1.5,
-                'recovery_steps': 5,
-                'metrics_affected': ['cpu_usage'],
-                'cooldown': 300,  # 5 minutes
-                'max_duration': 60,
-                'cascade_probability': 0.3
-            },
-            'memory_leak': {
-                'simulate': self._simulate_memory_leak,
-                'recovery': self._recover_memory_leak,
-                'impact_factor': 1.3,
-                'recovery_steps': 4,
-                'metrics_affected': ['memory_usage'],
-                'cooldown': 400,
-                'max_duration': 45,
-                'cascade_probability': 0.25
-            },
-            'disk_fill': {
-                'simulate': self._simulate_disk_fill,
-                'recovery': self._recover_disk_fill,
-                'impact_factor': 1.2,
-                'recovery_steps': 3,
-                'metrics_affected': ['disk_usage'],
-                'cooldown': 500,
-                'max_duration': 30,
-                'cascade_probability': 0.2
-            },
-            'io_stress': {
-                'simulate': self._simulate_io_stress,
-                'recovery': self._recover_io_stress,
-                'impact_factor': 1.4,
-                'recovery_steps': 4,
-                'metrics_affected': ['disk_usage', 'cpu_usage'],
-                'cooldown': 350,
-                'max_duration': 40,
-                'cascade_probability': 0.35
-            }
+            'cpu_overload': FaultConfig(
+                simulate=self._simulate_cpu_overload,
+                recovery=self._recover_cpu_overload,
+                impact_factor=1.5,
+                recovery_steps=5,
+                metrics_affected=('cpu_usage',),
+                cooldown=300,  # 5 minutes
+                max_duration=60,
+                cascade_probability=0.3
+            ),
+            'memory_leak': FaultConfig(
+                simulate=self._simulate_memory_leak,
+                recovery=self._recover_memory_leak,
+                impact_factor=1.3,
+                recovery_steps=4,
+                metrics_affected=('memory_usage',),
+                cooldown=400,
+                max_duration=45,
+                cascade_probability=0.25
+            ),
+            'disk_fill': FaultConfig(
+                simulate=self._simulate_disk_fill,
+                recovery=self._recover_disk_fill,
+                impact_factor=1.2,
+                recovery_steps=3,
+                metrics_affected=('disk_usage',),
+                cooldown=500,
+                max_duration=30,
+                cascade_probability=0.2
+            ),
+            'io_stress': FaultConfig(
+                simulate=self._simulate_io_stress,
+                recovery=self._recover_io_stress,
+                impact_factor=1.4,
+                recovery_steps=4,
+                metrics_affected=('disk_usage', 'cpu_usage'),
+                cooldown=350,
+                max_duration=40,
+                cascade_probability=0.35
+            )
+        }
+        
+        # Cascade candidates of each fault: every other fault type
+        self._cascade_candidates = {
+            fault_type: tuple(
+                (other, config)
+                for other, config in self.fault_types.items()
+                if other != fault_type
+            )
+            for fault_type in self.fault_types
         }
+        
+        # Precompute scaled ML features; they only depend on the fault type
+        self._base_features = np.array([
+            [1.0, 0.3, 0.1, 0.2],  # cpu_overload
+            [0.3, 1.0, 0.2, 0.3],  # memory_leak
+            [0.1, 0.2, 1.0, 0.3],  # disk_fill
+            [0.2, 0.3, 0.4, 1.0]   # io_stress
+        ])
+        self.scaler.fit(self._base_features)
+        
+        # One read-only float32 matrix; each fault type maps to a row view
+        self._features_matrix = np.ascontiguousarray(
+            self.scaler.transform(self._base_features), dtype=np.float32
+        )
+        self._features_matrix.setflags(write=False)
+        self._fault_index = {fault_type: i for i, fault_type in enumerate(self.fault_types)}
+        self._zero4 = np.zeros(4, dtype=np.float32)
+        self._zero4.setflags(write=False)
 
     def _setup_logging(self):
         """Setup logging configuration"""
         try:
-            if not os.path.exists('logs'):
-                os.makedirs('logs')
+            os.makedirs('logs', exist_ok=True)
                 
             logging.basicConfig(
                 filename='logs/fault_injector.log',
@@ -94,7 +167,7 @@ class FaultInjector:
         """Inject a system fault with ML-enhanced monitoring"""
         try:
             if fault_type not in self.fault_types:
-                self.logger.error(f"Unknown fault type: {fault_type}")
+                self.logger.error("Unknown fault type: %s", fault_type)
                 return False
                 
             config = self.fault_types[fault_type]
@@ -105,14 +178,20 @@ class FaultInjector:
                 
             # Validate and adjust duration
             if duration is None:
-                duration = config['max_duration']
-            duration = min(duration, config['max_duration'])
+                duration = config.max_duration
+            duration = min(duration, config.max_duration)
             
-            with self._lock:
-                # Record fault with ML metrics
+            with self._faults_lock:
+                # The recovery loop is gone after cleanup
+                if self._closed:
+                    self.logger.error("Cannot inject %s: fault injector is closed", fault_type)
+                    return False
+                
+                # Record fault with ML metrics; fault times are monotonic
+                now = time.monotonic()
                 fault_data = {
                     'active': True,
-                    'start_time': time.time(),
+                    'start_time': now,
                     'duration': duration,
                     'recovery_attempted': False,
                     'impact_metrics': {},
@@ -120,106 +199,119 @@ class FaultInjector:
                     'system_state_before': self._capture_system_state()
                 }
                 
-                self.active_faults[fault_type] = fault_data
-                self.last_fault_time[fault_type] = time.time()
+                faults = dict(self.active_faults)
+                faults[fault_type] = fault_data
+                self.active_faults = faults
+                self.last_fault_time[fault_type] = now
+                
+                # Replace the stop signal, stopping any earlier recovery
+                stop_event = asyncio.Event()
+                previous = self._stop_events.get(fault_type)
+                if previous is not None:
+                    self._loop.call_soon_threadsafe(previous.set)
+                self._stop_events[fault_type] = stop_event
                 
                 # Log fault injection
                 self.logger.info(
-                    f"Injecting fault: {fault_type}, "
-                    f"duration: {duration}s, "
-                    f"impact_factor: {config['impact_factor']}"
+                    "Injecting fault: %s, duration: %ss, impact_factor: %s",
+                    fault_type, duration, config.impact_factor
                 )
-            
-            # Start recovery thread
-            recovery_thread = threading.Thread(
-                target=self._execute_recovery,
-                args=(fault_type,),
-                daemon=True
-            )
-            recovery_thread.start()
+                
+                # Schedule recovery on the shared loop
+                recovery = asyncio.run_coroutine_threadsafe(
+                    self._execute_recovery(fault_type, stop_event),
+                    self._loop
+                )
+                self._recoveries.add(recovery)
+                recovery.add_done_callback(self._recoveries.discard)
             
             # Check for cascade effects
-            if random.random() < config['cascade_probability']:
+            if random.random() < config.cascade_probability:
                 self._trigger_cascade_effects(fault_type)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Error injecting fault: {e}")
+            self.logger.error("Error injecting fault: %s", e)
             return False
 
+    def inject_batch(self, fault_types: List[str], duration: Optional[int] = None) -> Dict[str, bool]:
+        """Inject several faults together so their durations overlap"""
+        # Held across the batch so other injections cannot interleave
+        with self._faults_lock:
+            return {
+                fault_type: self.inject_fault(fault_type, duration)
+                for fault_type in fault_types
+            }
+
     def _check_cooldown(self, fault_type: str) -> bool:
         """Check if fault type is in cooldown period"""
         try:
             if fault_type in self.last_fault_time:
-                cooldown = self.fault_types[fault_type]['cooldown']
-                time_since_last = time.time() - self.last_fault_time[fault_type]
+                cooldown = self.fault_types[fault_type].cooldown
+                time_since_last = time.monotonic() - self.last_fault_time[fault_type]
                 return time_since_last >= cooldown
             return True
             
         except Exception as e:
-            self.logger.error(f"Error checking cooldown: {e}")
+            self.logger.error("Error checking cooldown: %s", e)
             return False
 
     def _calculate_ml_features(self, fault_type: str) -> np.ndarray:
         """Calculate ML features for fault analysis"""
         try:
-            base_features = {
-                'cpu_overload': [1.0, 0.3, 0.1, 0.2],
-                'memory_leak': [0.3, 1.0, 0.2, 0.3],
-                'disk_fill': [0.1, 0.2, 1.0, 0.3],
-                'io_stress': [0.2, 0.3, 0.4, 1.0]
-            }
-            
-            features = base_features.get(fault_type, [0.0, 0.0, 0.0, 0.0])
-            return self.scaler.fit_transform(np.array(features).reshape(1, -1))[0]
+            index = self._fault_index.get(fault_type)
+            if index is None:
+                return self._zero4
+            return self._features_matrix[index]
             
         except Exception as e:
-            self.logger.error(f"Error calculating ML features: {e}")
-            return np.zeros(4)
+            self.logger.error("Error calculating ML features: %s", e)
+            return self._zero4
 
     def _capture_system_state(self) -> Dict[str, float]:
         """Capture current system state"""
         try:
-            return {
-                'cpu_usage': psutil.cpu_percent(),
-                'memory_usage': psutil.virtual_memory().percent,
-                'disk_usage': psutil.disk_usage('/').percent,
-                'timestamp': time.time()
-            }
+            with self._state_lock:
+                # Concurrent recoveries reuse a snapshot younger than the TTL
+                captured_at, state = self._state_cache
+                now = time.monotonic()
+                if state is None or now - captured_at >= self.state_ttl:
+                    state = {
+                        'cpu_usage': psutil.cpu_percent(interval=None),
+                        'memory_usage': psutil.virtual_memory().percent,
+                        'disk_usage': psutil.disk_usage('/').percent,
+                        'timestamp': time.time()
+                    }
+                    self._state_cache = (now, state)
+                return dict(state)
         except Exception as e:
-            self.logger.error(f"Error capturing system state: {e}")
+            self.logger.error("Error capturing system state: %s", e)
             return {}
 
     def _trigger_cascade_effects(self, primary_fault: str):
         """Trigger cascade effects based on ML analysis"""
         try:
-            cascade_candidates = {
-                fault_type: config
-                for fault_type, config in self.fault_types.items()
-                if fault_type != primary_fault
-            }
-            
-            for fault_type, config in cascade_candidates.items():
-                if random.random() < config['cascade_probability']:
-                    cascade_duration = int(config['max_duration'] * 0.5)
+            for fault_type, config in self._cascade_candidates[primary_fault]:
+                if random.random() < config.cascade_probability:
+                    cascade_duration = int(config.max_duration * 0.5)
                     self.inject_fault(fault_type, cascade_duration)
                     
                     self.logger.warning(
-                        f"Cascade effect triggered: {fault_type} "
-                        f"from primary fault: {primary_fault}"
+                        "Cascade effect triggered: %s from primary fault: %s",
+                        fault_type, primary_fault
                     )
                     
         except Exception as e:
-            self.logger.error(f"Error triggering cascade effects: {e}")
+            self.logger.error("Error triggering cascade effects: %s", e)
 
-    def _execute_recovery(self, fault_type: str):
+    async def _execute_recovery(self, fault_type: str, stop_event: asyncio.Event):
         """Execute ML-enhanced recovery process"""
         try:
-            self.logger.info(f"Starting recovery for {fault_type}")
+            self.logger.info("Starting recovery for %s", fault_type)
             
             config = self.fault_types[fault_type]
-            recovery_start = time.time()
+            recovery_start = time.monotonic()
             
             # Initialize recovery metrics
             recovery_metrics = {
@@ -230,11 +322,11 @@ class FaultInjector:
             }
             
             # Execute recovery steps
-            for step in range(config['recovery_steps']):
-                if not self.active_faults.get(fault_type, {}).get('active', False):
+            for step in range(config.recovery_steps):
+                if stop_event.is_set():
                     break
                     
-                success = config['recovery'](step)
+                success = await config.recovery(step)
                 if success:
                     recovery_metrics['steps_completed'] += 1
                 
@@ -244,18 +336,34 @@ class FaultInjector:
                     fault_type, current_state
                 )
                 
-                time.sleep(2)
+                # Pause between steps, waking early when stopped
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=2)
+                except asyncio.TimeoutError:
+                    pass
             
             # Update recovery metrics
-            recovery_metrics['duration'] = time.time() - recovery_start
+            recovery_metrics['duration'] = time.monotonic() - recovery_start
             recovery_metrics['success'] = (
-                recovery_metrics['steps_completed'] == config['recovery_steps']
+                recovery_metrics['steps_completed'] == config.recovery_steps
             )
             
-            with self._lock:
+            with self._faults_lock:
+                # A re-injection replaces the stop event; its entry belongs
+                # to the newer recovery, so a superseded run leaves it alone
+                if self._stop_events.get(fault_type) is not stop_event:
+                    self.logger.info("Recovery for %s superseded by re-injection", fault_type)
+                    return
+                
                 if fault_type in self.active_faults:
-                    self.active_faults[fault_type]['active'] = False
-                    self.active_faults[fault_type]['recovery_metrics'] = recovery_metrics
+                    faults = dict(self.active_faults)
+                    faults[fault_type] = {
+                        **faults[fault_type],
+                        'active': False,
+                        'recovery_metrics': recovery_metrics
+                    }
+                    self.active_faults = faults
+                stop_event.set()
             
             # Store recovery history
             self.recovery_history.append(recovery_metrics)
@@ -264,12 +372,12 @@ class FaultInjector:
             self._update_success_rate(fault_type, recovery_metrics['success'])
             
             self.logger.info(
-                f"Completed recovery for {fault_type}, "
-                f"success: {recovery_metrics['success']}"
+                "Completed recovery for %s, success: %s",
+                fault_type, recovery_metrics['success']
             )
             
         except Exception as e:
-            self.logger.error(f"Recovery error: {e}")
+            self.logger.error("Recovery error: %s", e)
 
     def _calculate_improvement(self, fault_type: str, current_state: Dict[str, float]) -> float:
         """Calculate improvement after recovery step"""
@@ -278,74 +386,92 @@ class FaultInjector:
                 return 0.0
                 
             initial_state = self.active_faults[fault_type]['system_state_before']
-            improvements = []
-            
-            for metric in self.fault_types[fault_type]['metrics_affected']:
-                if metric in initial_state and metric in current_state:
-                    initial = initial_state[metric]
-                    current = current_state[metric]
-                    if initial > current:
-                        improvement = (initial - current) / initial
-                        improvements.append(improvement)
+            improvements = [
+                (initial_state[metric] - current_state[metric]) / initial_state[metric]
+                for metric in self.fault_types[fault_type].metrics_affected
+                if metric in initial_state and metric in current_state
+                and initial_state[metric] > current_state[metric]
+            ]
             
-            return np.mean(improvements) if improvements else 0.0
+            # At most a few values; plain Python beats a numpy round trip
+            return sum(improvements) / len(improvements) if improvements else 0.0
             
         except Exception as e:
-            self.logger.error(f"Error calculating improvement: {e}")
+            self.logger.error("Error calculating improvement: %s", e)
             return 0.0
 
     def _update_success_rate(self, fault_type: str, success: bool):
         """Update fault recovery success rate"""
         try:
-            if fault_type not in self.fault_success_rate:
-                self.fault_success_rate[fault_type] = {
-                    'attempts': 0,
-                    'successes': 0
-                }
-            
-            self.fault_success_rate[fault_type]['attempts'] += 1
-            if success:
-                self.fault_success_rate[fault_type]['successes'] += 1
+            with self._stats_lock:
+                if fault_type not in self.fault_success_rate:
+                    self.fault_success_rate[fault_type] = {
+                        'attempts': 0,
+                        'successes': 0
+                    }
+                
+                self.fault_success_rate[fault_type]['attempts'] += 1
+                if success:
+                    self.fault_success_rate[fault_type]['successes'] += 1
+                self._stats_version += 1
                 
         except Exception as e:
-            self.logger.error(f"Error updating success rate: {e}")
+            self.logger.error("Error updating success rate: %s", e)
 
     def get_fault_statistics(self) -> Dict[str, Any]:
         """Get comprehensive fault statistics"""
         try:
+            with self._stats_lock:
+                # Rebuild success rates only after a recovery has finished
+                version, success_rates = self._success_rates_cache
+                if version != self._stats_version:
+                    success_rates = {
+                        fault_type: {
+                            'rate': stats['successes'] / stats['attempts']
+                            if stats['attempts'] > 0 else 0.0,
+                            'attempts': stats['attempts']
+                        }
+                        for fault_type, stats in self.fault_success_rate.items()
+                    }
+                    self._success_rates_cache = (self._stats_version, success_rates)
+            
+            faults = self.active_faults
+            now = time.monotonic()
             return {
-                'active_faults': len(self.active_faults),
+                'active_faults': len(faults),
                 'fault_history': len(self.fault_history),
-                'success_rates': {
-                    fault_type: {
-                        'rate': stats['successes'] / stats['attempts']
-                        if stats['attempts'] > 0 else 0.0,
-                        'attempts': stats['attempts']
-                    }
-                    for fault_type, stats in self.fault_success_rate.items()
-                },
+                'success_rates': success_rates,
                 'current_faults': {
                     fault_type: {
-                        'duration': time.time() - info['start_time'],
+                        'duration': now - info['start_time'],
                         'recovery_attempted': info['recovery_attempted']
                     }
-                    for fault_type, info in self.active_faults.items()
+                    for fault_type, info in faults.items()
                 }
             }
         except Exception as e:
-            self.logger.error(f"Error getting fault statistics: {e}")
+            self.logger.error("Error getting fault statistics: %s", e)
             return {}
 
     def _simulate_cpu_overload(self) -> bool:
         """Simulate CPU overload"""
         try:
-            # Create CPU load
-            end_time = time.time() + 5
-            while time.time() < end_time:
-                _ = [i * i for i in range(10000)]
+            # Create CPU load on every core, outside this interpreter's GIL
+            duration = 5
+            end_time = time.time() + duration
+            workers = [
+                multiprocessing.Process(target=_cpu_burn, args=(end_time,), daemon=True)
+                for _ in range(os.cpu_count() or 1)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(timeout=max(0.0, end_time - time.time()) + 1)
+                if worker.is_alive():
+                    worker.terminate()
             return True
-        except Exception as e:
-            self.logger.error(f"Error simulating CPU overload: {e}")
+        except OSError as e:
+            self.logger.error("Error simulating CPU overload: %s", e)
             return False
 
     def _simulate_memory_leak(self) -> bool:
@@ -356,87 +482,101 @@ class FaultInjector:
             time.sleep(2)
             del temp_data
             return True
-        except Exception as e:
-            self.logger.error(f"Error simulating memory leak: {e}")
+        except MemoryError as e:
+            self.logger.error("Error simulating memory leak: %s", e)
             return False
 
     def _simulate_disk_fill(self) -> bool:
         """Simulate disk fill"""
+        # Create temporary file
+        temp_file = 'temp_fault_test.tmp'
         try:
-            # Create temporary file
-            temp_file = 'temp_fault_test.tmp'
             with open(temp_file, 'wb') as f:
-                f.write(os.urandom(1024*1024))  # 1MB file
-            time.sleep(2)
-            os.remove(temp_file)
-            return True
-        except Exception as e:
-            self.logger.error(f"Error simulating disk fill: {e}")
+                f.write(self._MB_BUF)  # 1MB file
+        except OSError as e:
+            self.logger.error("Error simulating disk fill: %s", e)
             return False
+        time.sleep(2)
+        try:
+            os.remove(temp_file)
+        except FileNotFoundError:
+            pass
+        return True
 
     def _simulate_io_stress(self) -> bool:
         """Simulate I/O stress"""
         try:
-            # Create I/O load
-            for _ in range(5):
-                with open('io_test.tmp', 'wb') as f:
-                    f.write(os.urandom(1024*1024))
+            # Create I/O load through one descriptor
+            fd = os.open('io_test.tmp', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                for _ in range(5):
+                    os.write(fd, self._MB_BUF)
+            finally:
+                os.close(fd)
                 os.remove('io_test.tmp')
             return True
-        except Exception as e:
-            self.logger.error(f"Error simulating I/O stress: {e}")
+        except OSError as e:
+            self.logger.error("Error simulating I/O stress: %s", e)
             return False
 
-    def _recover_cpu_overload(self, step: int) -> bool:
+    async def _recover_cpu_overload(self, step: int) -> bool:
         """Recover from CPU overload"""
-        try:
-            time.sleep(1)  # Simulate recovery action
-            return True
-        except Exception as e:
-            self.logger.error(f"Error recovering from CPU overload: {e}")
-            return False
+        await asyncio.sleep(1)  # Simulate recovery action
+        return True
 
-    def _recover_memory_leak(self, step: int) -> bool:
+    async def _recover_memory_leak(self, step: int) -> bool:
         """Recover from memory leak"""
-        try:
-            import gc
-            gc.collect()
-            return True
-        except Exception as e:
-            self.logger.error(f"Error recovering from memory leak: {e}")
-            return False
+        # Collect off the loop thread so other recoveries keep running
+        await asyncio.get_running_loop().run_in_executor(None, gc.collect)
+        return True
 
-    def _recover_disk_fill(self, step: int) -> bool:
+    async def _recover_disk_fill(self, step: int) -> bool:
         """Recover from disk fill"""
-        try:
-            time.sleep(1)  # Simulate recovery action
-            return True
-        except Exception as e:
-            self.logger.error(f"Error recovering from disk fill: {e}")
-            return False
+        await asyncio.sleep(1)  # Simulate recovery action
+        return True
 
-    def _recover_io_stress(self, step: int) -> bool:
+    async def _recover_io_stress(self, step: int) -> bool:
         """Recover from I/O stress"""
-        try:
-            time.sleep(1)  # Simulate recovery action
-            return True
-        except Exception as e:
-            self.logger.error(f"Error recovering from I/O stress: {e}")
-            return False
+        await asyncio.sleep(1)  # Simulate recovery action
+        return True
+
+    def _stop_recoveries(self):
+        """Signal every running recovery to stop and wait for them to exit"""
+        with self._faults_lock:
+            for stop_event in self._stop_events.values():
+                self._loop.call_soon_threadsafe(stop_event.set)
+            recoveries = list(self._recoveries)
+        
+        # Stopped recoveries finish their current step, then exit
+        wait_futures(recoveries, timeout=5)
+
+    def cleanup(self):
+        """Stop running recoveries and shut down the recovery loop"""
+        with self._faults_lock:
+            if self._closed:
+                return
+            self._closed = True
+        
+        self._stop_recoveries()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=5)
+        if not self._loop_thread.is_alive():
+            self._loop.close()
+        self.logger.info("Stopped running fault recoveries")
 
     def get_active_faults(self) -> Dict[str, bool]:
         """Get information about active faults"""
-        with self._lock:
-            return {k: v['active'] for k, v in self.active_faults.items()}
+        faults = self.active_faults
+        return {k: v['active'] for k, v in faults.items()}
 
     def get_recovery_status(self) -> List[str]:
         """Get detailed recovery status"""
-        with self._lock:
-            status = []
-            for fault_type, info in self.active_faults.items():
-                if info['active']:
-                    if info['recovery_attempted']:
-                        status.append(f"Recovering from {fault_type}")
-                    else:
-                        status.append(f"Monitoring {fault_type}")
-            return status
+        faults = self.active_faults
+        status = []
+        for fault_type, info in faults.items():
+            if info['active']:
+                if info['recovery_attempted']:
+                    status.append(f"Recovering from {fault_type}")
+                else:
+                    status.append(f"Monitoring {fault_type}")
+        return status
@@ -0,0 +1,20 @@
+# app/jit.py
+# Optional Numba support for the numeric kernels. Numba is not a hard
+# dependency: without it, njit hands the function back unchanged and the
+# kernels run as plain Python. NUMBA_DISABLE_JIT=1 selects the same
+# plain-Python path with Numba installed.
+import os
+
+try:
+    if os.environ.get('NUMBA_DISABLE_JIT', '0') != '0':
+        raise ImportError('Numba JIT disabled by NUMBA_DISABLE_JIT')
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function as-is"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -6,19 +6,112 @@ import platform
 import logging
 from typing import Dict, Any
 from collections import deque
+from functools import lru_cache
 from datetime import datetime
 import numpy as np
+from app.jit import njit, NUMBA_AVAILABLE
+
+@lru_cache(maxsize=None)
+def _slope_basis(n):
+    """Centered positions and their sum of squares for an n-point slope"""
+    x = np.arange(n, dtype=np.float64)
+    x_centered = x - x.mean()
+    return x_centered, float(x_centered @ x_centered)
+
+@njit(cache=True, fastmath=True)
+def _trends_kernel_loop(hist, idx, length):
+    """Slopes of the value columns over the last length ring buffer rows"""
+    size, cols = hist.shape
+    slopes = np.zeros(cols - 1)
+    mean_x = (length - 1) / 2.0
+    x_var = 0.0
+    for j in range(length):
+        dx = j - mean_x
+        x_var += dx * dx
+        row = (idx - length + j) % size
+        for c in range(1, cols):
+            slopes[c - 1] += dx * hist[row, c]
+    for c in range(cols - 1):
+        slopes[c] /= x_var
+    return slopes
+
+def _trends_kernel_numpy(hist, idx, length):
+    """Slopes of the value columns over the last length ring buffer rows"""
+    start = idx - length
+    if start >= 0:
+        values = hist[start:idx, 1:]
+    else:
+        # Wrapped: stitch the tail and head of the buffer together
+        values = np.concatenate((hist[start:, 1:], hist[:idx, 1:]))
+    x_centered, x_var = _slope_basis(length)
+    return (x_centered @ values) / x_var
+
+@njit(cache=True)
+def _alerts_kernel_loop(values, crit, warn):
+    """Alert bitmask: bit i critical, bit i + n warning for component i"""
+    n = values.size
+    mask = 0
+    for i in range(n):
+        if values[i] >= crit[i]:
+            mask |= 1 << i
+        elif values[i] >= warn[i]:
+            mask |= 1 << (i + n)
+    return mask
+
+def _alerts_kernel_numpy(values, crit, warn):
+    """Alert bitmask: bit i critical, bit i + n warning for component i"""
+    n = values.size
+    bits = 1 << np.arange(n)
+    crit_mask = values >= crit
+    warn_mask = ~crit_mask & (values >= warn)
+    return int(crit_mask @ bits) | (int(warn_mask @ bits) << n)
+
+# Scalar loops only pay off once compiled; otherwise use the NumPy forms
+if NUMBA_AVAILABLE:
+    _trends_kernel = _trends_kernel_loop
+    _alerts_kernel = _alerts_kernel_loop
+    
+    # Compile (or load from cache) at import rather than on the first sample
+    _trends_kernel(np.zeros((4, 4)), 0, 2)
+    _alerts_kernel(np.zeros(3), np.ones(3), np.ones(3))
+else:
+    _trends_kernel = _trends_kernel_numpy
+    _alerts_kernel = _alerts_kernel_numpy
 
 class SystemMonitor:
+    TREND_METRICS = ('cpu_usage', 'memory_usage', 'disk_usage')
+    TREND_WINDOW = 10
+    ALERT_COMPONENTS = ('cpu', 'memory', 'disk')
+    
+    # Alert bitmask layout: bits 0-2 critical, bits 3-5 warning, each in
+    # ALERT_COMPONENTS order
+    _CRIT_MASK = 0b000111
+    _WARN_MASK = 0b111000
+    _ALERT_BITS = tuple(
+        [(c, 'critical') for c in ALERT_COMPONENTS] +
+        [(c, 'warning') for c in ALERT_COMPONENTS]
+    )
+    
+    # Shape of an empty sample; copied per call, never handed out directly
+    _EMPTY_METRICS = {
+        'cpu_usage': 0.0,
+        'memory_usage': 0.0,
+        'disk_usage': 0.0,
+        'cpu': {'usage': 0.0, 'user': 0.0, 'system': 0.0, 'frequency': 0.0},
+        'memory': {'usage': 0.0, 'available': 0.0, 'total': 0.0, 'swap_used': 0.0},
+        'disk': {'usage': 0.0, 'free': 0.0, 'total': 0.0, 'read_bytes': 0.0, 'write_bytes': 0.0},
+        'network': {'bytes_sent': 0.0, 'bytes_recv': 0.0, 'packets_sent': 0.0, 'packets_recv': 0.0},
+        'system': {'process_count': 0, 'boot_time': 0.0}
+    }
+
     def __init__(self):
         """Initialize the system monitor"""
         # Configure logging
         self._setup_logging()
         
         # Initialize monitoring components
-        self.metrics_history = deque(maxlen=100)
         self.event_history = deque(maxlen=50)
-        self.active_alerts = set()
+        self._alert_mask = 0
         
         # Configure thresholds
         self.thresholds = {
@@ -30,21 +123,52 @@ class SystemMonitor:
             'disk_warning': 80.0
         }
         
+        # Threshold vectors in ALERT_COMPONENTS order for vectorized checks
+        self._crit = np.array(
+            [self.thresholds[f'{c}_critical'] for c in self.ALERT_COMPONENTS]
+        )
+        self._warn = np.array(
+            [self.thresholds[f'{c}_warning'] for c in self.ALERT_COMPONENTS]
+        )
+        
+        # Per alert bit: component, level, metrics key, threshold and the
+        # upper-cased level used in log messages
+        self._alert_info = tuple(
+            (component, level, f'{component}_usage',
+             self.thresholds[f'{component}_{level}'], level.upper())
+            for component, level in self._ALERT_BITS
+        )
+        
         # Initialize monitoring state
         self.is_monitoring = False
         self.last_check_time = None
         self.monitoring_interval = 2  # seconds
         self.baseline_metrics = None
         self.last_metrics = None
-        self.metrics_history = deque(maxlen=100)
+        
+        # Last CPU reading; reads closer together than this are too coarse
+        self.cpu_min_interval = 0.2  # seconds
+        self._last_cpu_ts = 0.0
+        self._last_cpu_pct = 0.0
+        
+        # Metric history as a ring buffer of (timestamp, cpu, memory, disk)
+        # rows; float64 since float32 cannot resolve epoch timestamps
+        self.history_size = 100
+        self._hist = np.zeros((self.history_size, 4), dtype=np.float64)
+        self._hist_idx = 0
+        self._hist_len = 0
+        self._latest_metrics = None
+        
+        # Trends only change when a sample is recorded
+        self._trends_cache = None
+        self._trends_dirty = True
         
         self.logger.info("SystemMonitor initialized successfully")
 
     def _setup_logging(self):
         """Setup logging configuration"""
         try:
-            if not os.path.exists('logs'):
-                os.makedirs('logs')
+            os.makedirs('logs', exist_ok=True)
                 
             logging.basicConfig(
                 filename='logs/monitor.log',
@@ -60,10 +184,13 @@ class SystemMonitor:
         try:
             self.is_monitoring = True
             self.last_check_time = time.time()
+            
+            # Prime the CPU counters so non-blocking reads have a baseline
+            psutil.cpu_percent(interval=None)
             self.logger.info("System monitoring started")
             return True
-        except Exception as e:
-            self.logger.error(f"Error starting monitoring: {e}")
+        except Exception:
+            self.logger.exception("Error starting monitoring")
             return False
 
     def stop_monitoring(self):
@@ -72,164 +199,177 @@ class SystemMonitor:
             self.is_monitoring = False
             self.logger.info("System monitoring stopped")
             return True
-        except Exception as e:
-            self.logger.error(f"Error stopping monitoring: {e}")
+        except Exception:
+            self.logger.exception("Error stopping monitoring")
             return False
 
     def get_metrics(self) -> Dict[str, Any]:
-        """Get current system metrics"""
-        try:
-            metrics = self._collect_metrics()
-            
-            if metrics:
-                # Store metrics in history
-                self.metrics_history.append(metrics)
-                
-                # Check for alerts
-                self._check_alerts(metrics)
-                
-                # Update last check time
-                self.last_check_time = time.time()
-                
-            return metrics
-            
-        except Exception as e:
-            self.logger.error(f"Error getting metrics: {e}")
+        """Get current system metrics, or an empty sample while monitoring is stopped"""
+        if not self.is_monitoring:
             return self._generate_empty_metrics()
+        
+        metrics = self._collect_metrics()
+        
+        # Store metrics in history
+        self._record_metrics(metrics)
+        
+        # Check for alerts
+        self._check_alerts(metrics)
+        
+        # Update last check time
+        self.last_check_time = time.time()
+        
+        return metrics
+
+    def _read_cpu_percent(self) -> float:
+        """Non-blocking CPU usage, reusing reads within cpu_min_interval"""
+        now = time.monotonic()
+        if now - self._last_cpu_ts < self.cpu_min_interval:
+            return self._last_cpu_pct
+        self._last_cpu_pct = psutil.cpu_percent(interval=None)
+        self._last_cpu_ts = now
+        return self._last_cpu_pct
+
+    def _record_metrics(self, metrics: Dict[str, Any]):
+        """Write a sample into the history ring buffer"""
+        self._hist[self._hist_idx] = (
+            metrics['timestamp'],
+            metrics['cpu_usage'],
+            metrics['memory_usage'],
+            metrics['disk_usage']
+        )
+        self._hist_idx = (self._hist_idx + 1) % self.history_size
+        self._hist_len = min(self._hist_len + 1, self.history_size)
+        self._latest_metrics = metrics
+        self._trends_dirty = True
 
     def _collect_metrics(self) -> Dict[str, Any]:
         """Collect system metrics with delta calculations"""
         try:
-            # Get current metrics
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # Get current metrics (CPU usage since the previous read)
+            cpu_percent = self._read_cpu_percent()
+            cpu_times = psutil.cpu_times()
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
-            
-            # Calculate memory details
-            memory_total = memory.total
-            memory_available = memory.available
-            memory_used = memory_total - memory_available
-            memory_percent = (memory_used / memory_total) * 100
-            
-            # Calculate disk details
-            disk_total = disk.total
-            disk_used = disk.used
-            disk_percent = (disk_used / disk_total) * 100
-            
-            current_metrics = {
-                'timestamp': time.time(),
-                'cpu': {
-                    'usage': float(cpu_percent),
-                    'user': float(psutil.cpu_times().user),
-                    'system': float(psutil.cpu_times().system)
-                },
-                'memory': {
-                    'usage': float(memory_percent),
-                    'total': float(memory_total),
-                    'available': float(memory_available),
-                    'used': float(memory_used)
-                },
-                'disk': {
-                    'usage': float(disk_percent),
-                    'total': float(disk_total),
-                    'used': float(disk_used),
-                    'free': float(disk.free)
-                }
-            }
-            
-            # Calculate deltas if we have previous metrics
-            if self.last_metrics:
-                current_metrics['deltas'] = {
-                    'memory_usage': current_metrics['memory']['usage'] - 
-                                  self.last_metrics['memory']['usage'],
-                    'disk_usage': current_metrics['disk']['usage'] - 
-                                self.last_metrics['disk']['usage']
-                }
-            else:
-                current_metrics['deltas'] = {
-                    'memory_usage': 0.0,
-                    'disk_usage': 0.0
-                }
-            
-            # Store metrics
-            self.last_metrics = current_metrics
-            if not self.baseline_metrics:
-                self.baseline_metrics = current_metrics.copy()
-            
-            # Add simplified metrics
-            current_metrics.update({
-                'cpu_usage': current_metrics['cpu']['usage'],
-                'memory_usage': current_metrics['memory']['usage'],
-                'disk_usage': current_metrics['disk']['usage']
-            })
-            
-            return current_metrics
-            
-        except Exception as e:
-            self.logger.error(f"Error collecting metrics: {e}")
+        except (OSError, psutil.Error):
+            self.logger.exception("Error collecting metrics")
             return self._generate_empty_metrics()
+        
+        # Calculate memory details (psutil already derives the percent)
+        memory_total = memory.total
+        memory_available = memory.available
+        
+        # Calculate disk details
+        disk_total = disk.total
+        disk_used = disk.used
+        disk_percent = (disk_used / disk_total) * 100
+        
+        current_metrics = {
+            'timestamp': time.time(),
+            'cpu': {
+                'usage': cpu_percent,
+                'user': cpu_times.user,
+                'system': cpu_times.system
+            },
+            'memory': {
+                'usage': memory.percent,
+                'total': memory_total,
+                'available': memory_available,
+                'used': memory_total - memory_available
+            },
+            'disk': {
+                'usage': disk_percent,
+                'total': disk_total,
+                'used': disk_used,
+                'free': disk.free
+            }
+        }
+        
+        # Calculate deltas if we have previous metrics
+        if self.last_metrics:
+            current_metrics['deltas'] = {
+                'memory_usage': current_metrics['memory']['usage'] - 
+                              self.last_metrics['memory']['usage'],
+                'disk_usage': current_metrics['disk']['usage'] - 
+                            self.last_metrics['disk']['usage']
+            }
+        else:
+            current_metrics['deltas'] = {
+                'memory_usage': 0.0,
+                'disk_usage': 0.0
+            }
+        
+        # Store metrics
+        self.last_metrics = current_metrics
+        if not self.baseline_metrics:
+            self.baseline_metrics = current_metrics.copy()
+        
+        # Add simplified metrics
+        current_metrics.update({
+            'cpu_usage': current_metrics['cpu']['usage'],
+            'memory_usage': current_metrics['memory']['usage'],
+            'disk_usage': current_metrics['disk']['usage']
+        })
+        
+        return current_metrics
 
     def _check_alerts(self, metrics: Dict[str, Any]):
         """Check metrics against thresholds and generate alerts"""
         try:
-            current_alerts = set()
+            values = np.array(
+                [metrics['cpu_usage'], metrics['memory_usage'], metrics['disk_usage']]
+            )
             
-            # Check CPU
-            if metrics['cpu_usage'] >= self.thresholds['cpu_critical']:
-                current_alerts.add(('cpu', 'critical'))
-            elif metrics['cpu_usage'] >= self.thresholds['cpu_warning']:
-                current_alerts.add(('cpu', 'warning'))
-                
-            # Check Memory
-            if metrics['memory_usage'] >= self.thresholds['memory_critical']:
-                current_alerts.add(('memory', 'critical'))
-            elif metrics['memory_usage'] >= self.thresholds['memory_warning']:
-                current_alerts.add(('memory', 'warning'))
-                
-            # Check Disk
-            if metrics['disk_usage'] >= self.thresholds['disk_critical']:
-                current_alerts.add(('disk', 'critical'))
-            elif metrics['disk_usage'] >= self.thresholds['disk_warning']:
-                current_alerts.add(('disk', 'warning'))
+            # Critical takes precedence over warning for each component
+            mask = int(_alerts_kernel(values, self._crit, self._warn))
             
-            # Log new alerts
-            new_alerts = current_alerts - self.active_alerts
-            for component, level in new_alerts:
-                self._log_alert(component, level, metrics)
+            # Log new alerts, lowest set bit first
+            new_alerts = mask & ~self._alert_mask
+            while new_alerts:
+                bit = new_alerts & -new_alerts
+                self._log_alert(bit.bit_length() - 1, metrics)
+                new_alerts ^= bit
             
             # Update active alerts
-            self.active_alerts = current_alerts
+            self._alert_mask = mask
             
-        except Exception as e:
-            self.logger.error(f"Error checking alerts: {e}")
+        except Exception:
+            self.logger.exception("Error checking alerts")
+
+    @property
+    def active_alerts(self):
+        """Active alerts as a set of (component, level) tuples"""
+        mask = self._alert_mask
+        return {alert for i, alert in enumerate(self._ALERT_BITS) if mask >> i & 1}
 
-    def _log_alert(self, component: str, level: str, metrics: Dict[str, Any]):
+    def _log_alert(self, bit_index: int, metrics: Dict[str, Any]):
         """Log system alerts"""
         try:
+            component, level, usage_key, threshold, level_name = self._alert_info[bit_index]
             alert = {
                 'timestamp': datetime.now().isoformat(),
                 'component': component,
                 'level': level,
-                'value': metrics.get(f'{component}_usage', 0),
-                'threshold': self.thresholds[f'{component}_{level}']
+                'value': metrics.get(usage_key, 0),
+                'threshold': threshold
             }
             
             self.event_history.append(alert)
             self.logger.warning(
-                f"{level.upper()} alert: {component} usage at "
-                f"{alert['value']:.1f}% (threshold: {alert['threshold']}%)"
+                "%s alert: %s usage at %.1f%% (threshold: %s%%)",
+                level_name, component, alert['value'], threshold
             )
             
-        except Exception as e:
-            self.logger.error(f"Error logging alert: {e}")
+        except Exception:
+            self.logger.exception("Error logging alert")
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status"""
         try:
-            if not self.metrics_history:
+            if self._latest_metrics is None:
                 return self._generate_empty_status()
             
-            latest_metrics = self.metrics_history[-1]
+            latest_metrics = self._latest_metrics
             
             return {
                 'timestamp': datetime.now().isoformat(),
@@ -240,55 +380,51 @@ class SystemMonitor:
                 'events': list(self.event_history)
             }
             
-        except Exception as e:
-            self.logger.error(f"Error getting system status: {e}")
+        except Exception:
+            self.logger.exception("Error getting system status")
             return self._generate_empty_status()
 
     def _determine_status(self, metrics: Dict[str, Any]) -> str:
         """Determine overall system status"""
         try:
-            if any(alert[1] == 'critical' for alert in self.active_alerts):
+            if self._alert_mask & self._CRIT_MASK:
                 return 'critical'
-            elif any(alert[1] == 'warning' for alert in self.active_alerts):
+            elif self._alert_mask & self._WARN_MASK:
                 return 'warning'
             return 'healthy'
             
-        except Exception as e:
-            self.logger.error(f"Error determining status: {e}")
+        except Exception:
+            self.logger.exception("Error determining status")
             return 'unknown'
 
     def _calculate_trends(self) -> Dict[str, float]:
         """Calculate system metric trends"""
         try:
-            if len(self.metrics_history) < 2:
+            if self._hist_len < 2:
                 return self._generate_empty_trends()
             
-            recent_metrics = list(self.metrics_history)[-10:]
-            
-            trends = {}
-            for metric in ['cpu_usage', 'memory_usage', 'disk_usage']:
-                values = [m[metric] for m in recent_metrics]
-                trends[metric] = float(np.polyfit(range(len(values)), values, 1)[0])
+            if self._trends_dirty:
+                n = min(self._hist_len, self.TREND_WINDOW)
+                
+                # Least-squares slope of all three series in one pass
+                slopes = _trends_kernel(self._hist, self._hist_idx, n)
+                
+                self._trends_cache = dict(zip(self.TREND_METRICS, slopes.tolist()))
+                self._trends_dirty = False
             
-            return trends
+            return dict(self._trends_cache)
             
-        except Exception as e:
-            self.logger.error(f"Error calculating trends: {e}")
+        except Exception:
+            self.logger.exception("Error calculating trends")
             return self._generate_empty_trends()
 
     def _generate_empty_metrics(self) -> Dict[str, Any]:
         """Generate empty metrics structure"""
-        return {
-            'timestamp': time.time(),
-            'cpu_usage': 0.0,
-            'memory_usage': 0.0,
-            'disk_usage': 0.0,
-            'cpu': {'usage': 0.0, 'user': 0.0, 'system': 0.0, 'frequency': 0.0},
-            'memory': {'usage': 0.0, 'available': 0.0, 'total': 0.0, 'swap_used': 0.0},
-            'disk': {'usage': 0.0, 'free': 0.0, 'total': 0.0, 'read_bytes': 0.0, 'write_bytes': 0.0},
-            'network': {'bytes_sent': 0.0, 'bytes_recv': 0.0, 'packets_sent': 0.0, 'packets_recv': 0.0},
-            'system': {'process_count': 0, 'boot_time': 0.0}
-        }
+        # Fresh top level and sections, so callers may update the result
+        metrics = {'timestamp': time.time()}
+        for key, value in self._EMPTY_METRICS.items():
+            metrics[key] = dict(value) if isinstance(value, dict) else value
+        return metrics
 
     def _generate_empty_status(self) -> Dict[str, Any]:
         """Generate empty status structure"""
@@ -314,7 +450,7 @@ class SystemMonitor:
         return {
             'is_monitoring': self.is_monitoring,
             'last_check': self.last_check_time,
-            'active_alerts': len(self.active_alerts),
-            'metrics_collected': len(self.metrics_history),
+            'active_alerts': self._alert_mask.bit_count(),
+            'metrics_collected': self._hist_len,
             'events_logged': len(self.event_history)
         }
@@ -1,6 +1,5 @@
 # app/optimizer.py
 import numpy as np
-from sklearn.ensemble import IsolationForest
 import psutil
 import logging
 import os
@@ -11,35 +10,37 @@ import platform
 
 class SystemOptimizer:
     def __init__(self):
-        # Initialize components
-        self.anomaly_detector = IsolationForest(
-            contamination=0.1,
-            random_state=42
-        )
-        
         # Optimization parameters
         self.threshold_critical = 90.0
         self.threshold_warning = 70.0
         
+        # Platform is fixed for the life of the process
+        self._is_windows = platform.system() == 'Windows'
+        
         # History tracking
         self.optimization_history = deque(maxlen=50)
         self.active_optimizations = set()
         
-        # Cooldown tracking
+        # Cooldown tracking (time.monotonic readings)
         self.last_optimization_time = {}
         self.optimization_cooldown = 300  # 5 minutes
         
+        # Heavy process scans, cached per (attribute, threshold)
+        self._proc_cache = {}
+        self._proc_cache_ttl = 10.0  # seconds
+        
         # Setup logging
         self._setup_logging()
         
         # Initialize optimization actions
         self.optimization_actions = self._initialize_actions()
+        self._actions_list = list(self.optimization_actions.values())
+        self._actions_by_id = {action['id']: action for action in self._actions_list}
 
     def _setup_logging(self):
         """Initialize logging configuration"""
         try:
-            if not os.path.exists('logs'):
-                os.makedirs('logs')
+            os.makedirs('logs', exist_ok=True)
                 
             logging.basicConfig(
                 filename='logs/optimizer.log',
@@ -83,12 +84,12 @@ class SystemOptimizer:
         """Analyze system and determine if optimization is needed"""
         try:
             needed_optimizations = []
+            now = time.monotonic()
             
             # Check each optimization action
-            for action in self.optimization_actions.values():
+            for action in self._actions_list:
                 # Skip if in cooldown
-                if (action['id'] in self.last_optimization_time and 
-                    time.time() - self.last_optimization_time[action['id']] < action['cooldown']):
+                if self._cooldown_remaining(action, now) > 0:
                     continue
                 
                 # Check if conditions are met
@@ -102,8 +103,8 @@ class SystemOptimizer:
             
             return needed_optimizations
             
-        except Exception as e:
-            self.logger.error(f"Error checking system: {e}")
+        except Exception:
+            self.logger.exception("Error checking system")
             return []
 
     def _calculate_priority(self, metrics, action_id):
@@ -125,18 +126,15 @@ class SystemOptimizer:
             else:
                 return 'medium'
                 
-        except Exception as e:
-            self.logger.error(f"Error calculating priority: {e}")
+        except Exception:
+            self.logger.exception("Error calculating priority")
             return 'medium'
 
     def optimize(self, action_id, metrics):
         """Execute optimization action"""
         try:
             # Find the requested action
-            action = next(
-                (a for a in self.optimization_actions.values() if a['id'] == action_id),
-                None
-            )
+            action = self._actions_by_id.get(action_id)
             
             if not action:
                 return False, "Unknown optimization action"
@@ -146,14 +144,13 @@ class SystemOptimizer:
                 return False, "Optimization already in progress"
             
             # Check cooldown
-            if (action_id in self.last_optimization_time and 
-                time.time() - self.last_optimization_time[action_id] < action['cooldown']):
+            if self._cooldown_remaining(action, time.monotonic()) > 0:
                 return False, "Optimization in cooldown"
             
             # Execute optimization
             self.active_optimizations.add(action_id)
             success = action['function']()
-            self.last_optimization_time[action_id] = time.time()
+            self.last_optimization_time[action_id] = time.monotonic()
             
             # Record optimization
             self.optimization_history.append({
@@ -169,34 +166,52 @@ class SystemOptimizer:
             return success, f"Completed {action['name']}"
             
         except Exception as e:
-            self.logger.error(f"Error in optimization: {e}")
+            self.logger.exception("Error in optimization")
             if action_id in self.active_optimizations:
                 self.active_optimizations.discard(action_id)
             return False, str(e)
 
+    def _heavy_processes(self, attr, threshold):
+        """Other processes whose attr exceeds threshold, cached for a TTL"""
+        key = (attr, threshold)
+        now = time.monotonic()
+        cached = self._proc_cache.get(key)
+        if cached is not None and now - cached[0] < self._proc_cache_ttl:
+            return cached[1]
+        
+        # process_iter reads the requested attributes under oneshot()
+        own_pid = os.getpid()
+        procs = []
+        for proc in psutil.process_iter(['pid', 'name', attr]):
+            value = proc.info[attr]
+            if proc.info['pid'] != own_pid and value is not None and value > threshold:
+                procs.append(proc)
+        
+        self._proc_cache[key] = (now, procs)
+        return procs
+
     def _optimize_cpu(self):
         """Optimize CPU usage"""
         try:
             self.logger.info("Starting CPU optimization")
             optimized = False
             
+            # BELOW_NORMAL_PRIORITY_CLASS only exists in psutil on Windows
+            nice_value = psutil.BELOW_NORMAL_PRIORITY_CLASS if self._is_windows else 10
+            
             # Get CPU-intensive processes
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
+            for proc in self._heavy_processes('cpu_percent', 50.0):
                 try:
-                    if proc.info['cpu_percent'] > 50.0:
-                        # Reduce priority of CPU-intensive processes
-                        if platform.system() == 'Windows':
-                            proc.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
-                        else:
-                            proc.nice(10)
-                        optimized = True
+                    # Reduce priority of CPU-intensive processes
+                    proc.nice(nice_value)
+                    optimized = True
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
             return optimized
             
-        except Exception as e:
-            self.logger.error(f"Error in CPU optimization: {e}")
+        except Exception:
+            self.logger.exception("Error in CPU optimization")
             return False
 
     def _optimize_memory(self):
@@ -206,25 +221,34 @@ class SystemOptimizer:
             optimized = False
             
             # Get memory-intensive processes
-            for proc in psutil.process_iter(['pid', 'name', 'memory_percent']):
-                try:
-                    if proc.info['memory_percent'] > 20.0:
-                        if platform.system() == 'Windows':
-                            # Trigger garbage collection for Python processes
-                            if proc.info['name'].lower().startswith('python'):
-                                import gc
-                                gc.collect()
-                        else:
-                            # Request memory trim on Unix systems
-                            os.system(f"echo 1 > /proc/{proc.info['pid']}/oom_score_adj")
+            procs = self._heavy_processes('memory_percent', 20.0)
+            
+            if self._is_windows:
+                for proc in procs:
+                    # Trigger garbage collection for Python processes
+                    if proc.info['name'].lower().startswith('python'):
+                        import gc
+                        gc.collect()
+                    optimized = True
+            else:
+                # Request memory trim on Unix systems by writing each
+                # process's OOM score adjustment directly, in one pass
+                for proc in procs:
+                    # The list may be up to a TTL old and a raw /proc path
+                    # skips psutil's PID-reuse check, so confirm it first
+                    if not proc.is_running():
+                        continue
+                    try:
+                        with open(f"/proc/{proc.pid}/oom_score_adj", 'wb') as f:
+                            f.write(b'1')
                         optimized = True
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+                    except OSError:
+                        continue
             
             return optimized
             
-        except Exception as e:
-            self.logger.error(f"Error in memory optimization: {e}")
+        except Exception:
+            self.logger.exception("Error in memory optimization")
             return False
 
     def _optimize_disk(self):
@@ -234,22 +258,24 @@ class SystemOptimizer:
             optimized = False
             
             # Clean temporary files
-            temp_dirs = ['/tmp', '/var/tmp'] if platform.system() != 'Windows' else [
+            temp_dirs = ['/tmp', '/var/tmp'] if not self._is_windows else [
                 os.environ.get('TEMP'),
                 os.environ.get('TMP')
             ]
             
+            # Remove files older than 1 day
+            cutoff = time.time() - 86400
+            
             for temp_dir in temp_dirs:
                 if temp_dir and os.path.exists(temp_dir):
                     try:
-                        # Remove files older than 1 day
-                        current_time = time.time()
-                        for item in os.listdir(temp_dir):
-                            item_path = os.path.join(temp_dir, item)
-                            if os.path.isfile(item_path):
-                                if current_time - os.path.getctime(item_path) > 86400:
+                        # scandir entries cache their type and stat results
+                        with os.scandir(temp_dir) as entries:
+                            for entry in entries:
+                                if (entry.is_file(follow_symlinks=False) and
+                                        entry.stat(follow_symlinks=False).st_ctime < cutoff):
                                     try:
-                                        os.remove(item_path)
+                                        os.unlink(entry.path)
                                         optimized = True
                                     except OSError:
                                         continue
@@ -258,32 +284,39 @@ class SystemOptimizer:
             
             return optimized
             
-        except Exception as e:
-            self.logger.error(f"Error in disk optimization: {e}")
+        except Exception:
+            self.logger.exception("Error in disk optimization")
             return False
 
+    def _cooldown_remaining(self, action, now):
+        """Seconds until an action may run again; 0 if it has never run"""
+        last_run = self.last_optimization_time.get(action['id'])
+        if last_run is None:
+            return 0
+        return max(0, action['cooldown'] - (now - last_run))
+
     def get_optimization_status(self):
         """Get current optimization status"""
+        now = time.monotonic()
         return {
             'active_optimizations': list(self.active_optimizations),
             'recent_history': list(self.optimization_history)[-5:],
             'cooldowns': {
-                action['id']: max(0, action['cooldown'] - 
-                    (time.time() - self.last_optimization_time.get(action['id'], 0)))
-                for action in self.optimization_actions.values()
+                action['id']: self._cooldown_remaining(action, now)
+                for action in self._actions_list
             }
         }
 
     def get_available_actions(self):
         """Get list of available optimization actions"""
+        now = time.monotonic()
         return [
             {
                 'id': action['id'],
                 'name': action['name'],
                 'description': action['description'],
                 'cooldown': action['cooldown'],
-                'cooldown_remaining': max(0, action['cooldown'] - 
-                    (time.time() - self.last_optimization_time.get(action['id'], 0)))
+                'cooldown_remaining': self._cooldown_remaining(action, now)
             }
-            for action in self.optimization_actions.values()
+            for action in self._actions_list
         ]
@@ -5,18 +5,76 @@ from sklearn.preprocessing import StandardScaler
 import logging
 from collections import deque
 import os
-from datetime import datetime
+import time
+from bisect import bisect_left, bisect_right
+from app.jit import njit, NUMBA_AVAILABLE
+
+@njit(cache=True)
+def _health(cpu, memory, disk):
+    """Weighted health score clamped to [0, 100]"""
+    score = 100.0 - 0.4 * cpu - 0.3 * memory - 0.3 * disk
+    return 0.0 if score < 0.0 else (100.0 if score > 100.0 else score)
+
+@njit(cache=True)
+def _trend(first, last, n):
+    """Simple linear trend across an n-reading window"""
+    return (last - first) / n
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) at import rather than on the first tick
+    _health(0.0, 0.0, 0.0)
+    _trend(0.0, 0.0, 1)
+
+# Time-to-failure labels: index is how many thresholds the probability exceeds
+_TTF_THRESH = (0.3, 0.5, 0.7, 0.9)
+_TTF_LABEL = ("No immediate risk", "3-12 hours", "1-3 hours", "< 1 hour", "Immediate risk")
+
+# Status labels: index is how many thresholds the health score reaches
+_STATUS_THRESH = (60, 80)
+_STATUS_LABEL = ("critical", "warning", "healthy")
 
 class FailurePredictor:
     def __init__(self):
         # Initialize basic components
-        self.model = IsolationForest(contamination=0.1, random_state=42)
+        self.model = IsolationForest(
+            n_estimators=100,
+            contamination=0.1,
+            random_state=42,
+            n_jobs=-1
+        )
         self.scaler = StandardScaler()
         
+        # Feature row reused across ticks; sklearn copies what it keeps.
+        # float32 end to end, since the forest validates input as float32
+        self._feat_buf = np.empty((1, 3), dtype=np.float32)
+        
         # Data management
-        self.metrics_history = deque(maxlen=60)  # Keep last 60 readings
+        self.history_size = 60  # Keep last 60 readings
+        self.metrics_history = deque(maxlen=self.history_size)
         self.prediction_history = deque(maxlen=30)
         
+        # cpu/memory/disk rows in a fixed ring buffer, fed to the model as-is
+        self._hist = np.empty((self.history_size, 3), dtype=np.float32)
+        self._hist_i = 0
+        self._hist_n = 0
+        
+        # Trend windows: last 5 readings per metric, updated on each append
+        self.trend_window = 5
+        self._cpu_win = deque(maxlen=self.trend_window)
+        self._mem_win = deque(maxlen=self.trend_window)
+        self._disk_win = deque(maxlen=self.trend_window)
+        
+        # Model refresh: fit once enough history has accumulated, then refit
+        # every N predictions and only score the newest row in between
+        self.min_fit_samples = 20
+        self.refit_interval = 30
+        self._fit_counter = 0
+        self._fitted = False
+        
+        # Latest anomaly decision, keyed on the rounded reading it was made for
+        self._last_features = None
+        self._last_anomaly = 1
+        
         # Thresholds
         self.critical_threshold = 90.0
         self.warning_threshold = 70.0
@@ -27,8 +85,7 @@ class FailurePredictor:
     def _setup_logging(self):
         """Setup logging configuration"""
         try:
-            if not os.path.exists('logs'):
-                os.makedirs('logs')
+            os.makedirs('logs', exist_ok=True)
             
             logging.basicConfig(
                 filename='logs/predictor.log',
@@ -42,37 +99,59 @@ class FailurePredictor:
     def _prepare_features(self, metrics):
         """Prepare features for ML prediction"""
         try:
-            features = [
-                metrics['cpu_usage'],
-                metrics['memory_usage'],
-                metrics['disk_usage']
-            ]
-            return np.array(features).reshape(1, -1)
+            features = self._feat_buf
+            features[0, 0] = metrics['cpu_usage']
+            features[0, 1] = metrics['memory_usage']
+            features[0, 2] = metrics['disk_usage']
+            return features
         except Exception as e:
             self.logger.error(f"Error preparing features: {e}")
             return None
 
+    def _fit_model(self):
+        """Fit the anomaly model on the accumulated metrics history"""
+        try:
+            # Row order does not matter for fitting, so no unwrapping needed
+            self.model.fit(self._hist[:self._hist_n])
+            self._fitted = True
+            self._last_features = None
+            
+        except Exception as e:
+            self.logger.error(f"Error fitting anomaly model: {e}")
+
+    def _score_latest(self, metrics, features):
+        """Classify the newest reading as 1 (normal) or -1 (anomaly)"""
+        # No model yet means behavior is treated as normal
+        if not self._fitted:
+            return 1
+        
+        # Consecutive readings often repeat at 0.1% resolution and the model
+        # only changes on refit, so the previous decision can be reused
+        key = (
+            round(metrics['cpu_usage'], 1),
+            round(metrics['memory_usage'], 1),
+            round(metrics['disk_usage'], 1)
+        )
+        if key != self._last_features:
+            # Negative decision values are outliers
+            self._last_anomaly = -1 if self.model.decision_function(features)[0] < 0 else 1
+            self._last_features = key
+        
+        return self._last_anomaly
+
     def _calculate_trends(self):
         """Calculate system metric trends"""
-        if len(self.metrics_history) < 2:
+        if len(self._cpu_win) < 2:
             return {'cpu': 0.0, 'memory': 0.0, 'disk': 0.0}
 
         try:
-            recent_metrics = list(self.metrics_history)[-5:]  # Last 5 readings
-            
-            trends = {
-                'cpu': 0.0,
-                'memory': 0.0,
-                'disk': 0.0
+            # Simple linear trend over each metric's window
+            return {
+                'cpu': float(_trend(self._cpu_win[0], self._cpu_win[-1], len(self._cpu_win))),
+                'memory': float(_trend(self._mem_win[0], self._mem_win[-1], len(self._mem_win))),
+                'disk': float(_trend(self._disk_win[0], self._disk_win[-1], len(self._disk_win)))
             }
             
-            for metric in ['cpu', 'memory', 'disk']:
-                values = [m[f'{metric}_usage'] for m in recent_metrics]
-                trend = (values[-1] - values[0]) / len(values)  # Simple linear trend
-                trends[metric] = float(trend)
-            
-            return trends
-            
         except Exception as e:
             self.logger.error(f"Error calculating trends: {e}")
             return {'cpu': 0.0, 'memory': 0.0, 'disk': 0.0}
@@ -80,20 +159,13 @@ class FailurePredictor:
     def _calculate_health_score(self, metrics):
         """Calculate overall system health score"""
         try:
-            weights = {
-                'cpu': 0.4,
-                'memory': 0.3,
-                'disk': 0.3
-            }
-            
-            health_score = 100.0 - (
-                weights['cpu'] * metrics['cpu_usage'] +
-                weights['memory'] * metrics['memory_usage'] +
-                weights['disk'] * metrics['disk_usage']
+            # Weights: cpu 0.4, memory 0.3, disk 0.3
+            return _health(
+                metrics['cpu_usage'],
+                metrics['memory_usage'],
+                metrics['disk_usage']
             )
             
-            return max(0.0, min(100.0, health_score))
-            
         except Exception as e:
             self.logger.error(f"Error calculating health score: {e}")
             return 100.0
@@ -103,14 +175,28 @@ class FailurePredictor:
         try:
             # Store metrics in history
             self.metrics_history.append(metrics)
+            self._cpu_win.append(metrics['cpu_usage'])
+            self._mem_win.append(metrics['memory_usage'])
+            self._disk_win.append(metrics['disk_usage'])
+            self._fit_counter += 1
             
             # Prepare features
             features = self._prepare_features(metrics)
             if features is None:
                 return self._generate_default_prediction()
+            
+            # Keep the row in the ring buffer the model is fitted on
+            self._hist[self._hist_i % self.history_size] = features[0]
+            self._hist_i += 1
+            self._hist_n = min(self.history_size, self._hist_n + 1)
+
+            # Periodically refit on history rather than on every tick
+            if self._hist_n >= self.min_fit_samples and (
+                    not self._fitted or self._fit_counter % self.refit_interval == 0):
+                self._fit_model()
 
             # Get anomaly score
-            anomaly_score = self.model.fit_predict(features)[0]
+            anomaly_score = self._score_latest(metrics, features)
             
             # Calculate failure probability
             base_probability = max(
@@ -139,7 +225,7 @@ class FailurePredictor:
             
             # Store prediction
             self.prediction_history.append({
-                'timestamp': datetime.now(),
+                'timestamp': time.monotonic_ns(),
                 'probability': failure_probability,
                 'health_score': health_score
             })
@@ -160,16 +246,8 @@ class FailurePredictor:
     def _estimate_time_to_failure(self, probability, trends):
         """Estimate time until potential failure"""
         try:
-            if probability > 0.9:
-                return "Immediate risk"
-            elif probability > 0.7:
-                return "< 1 hour"
-            elif probability > 0.5:
-                return "1-3 hours"
-            elif probability > 0.3:
-                return "3-12 hours"
-            else:
-                return "No immediate risk"
+            # bisect_left counts thresholds strictly below the probability
+            return _TTF_LABEL[bisect_left(_TTF_THRESH, probability)]
                 
         except Exception as e:
             self.logger.error(f"Error estimating time to failure: {e}")
@@ -177,12 +255,8 @@ class FailurePredictor:
 
     def _get_status(self, health_score):
         """Determine system status based on health score"""
-        if health_score >= 80:
-            return "healthy"
-        elif health_score >= 60:
-            return "warning"
-        else:
-            return "critical"
+        # bisect_right counts thresholds at or below the score
+        return _STATUS_LABEL[bisect_right(_STATUS_THRESH, health_score)]
 
     def _generate_default_prediction(self):
         """Generate default prediction when analysis fails"""
@@ -204,12 +278,17 @@ class FailurePredictor:
                     'confidence': 0.0
                 }
 
-            recent_predictions = list(self.prediction_history)
-            probabilities = [p['probability'] for p in recent_predictions]
+            probabilities = np.fromiter(
+                (p['probability'] for p in self.prediction_history),
+                dtype=np.float64,
+                count=len(self.prediction_history)
+            )
             
+            # mean(1 - p) == 1 - mean(p), so one reduction serves both
+            accuracy = 1.0 - np.mean(probabilities)
             return {
-                'accuracy': 1.0 - np.mean(probabilities),
-                'confidence': np.mean([1.0 - p['probability'] for p in recent_predictions])
+                'accuracy': accuracy,
+                'confidence': accuracy
             }
 
         except Exception as e:
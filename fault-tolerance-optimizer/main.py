@@ -1,12 +1,13 @@
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, render_template, jsonify
 from flask_cors import CORS
+import os
 import threading
 import time
 import psutil
 import logging
-from sklearn.ensemble import IsolationForest
-import numpy as np
+import orjson
 from datetime import datetime
+from app.predictor import FailurePredictor
 
 app = Flask(__name__)
 CORS(app)
@@ -15,48 +16,48 @@ CORS(app)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global variables for storing metrics
-metrics_history = []
-anomaly_detector = IsolationForest(contamination=0.1, random_state=42)
+# Shared prediction state: the predictor owns the metrics history and the
+# anomaly model, and is only driven by the monitoring thread
+predictor = FailurePredictor()
 active_remediation = False
 
-def get_system_metrics():
-    """Collect basic system metrics"""
+# Latest prediction from the monitoring thread, served by /api/metrics;
+# the thread swaps in a new dict under the lock rather than mutating it
+_latest_prediction = {'failure_probability': 0.0}
+_pred_lock = threading.Lock()
+
+# Monitoring loop control: waits on the event so shutdown is immediate, and
+# backs off while the CPU is saturated
+_stop = threading.Event()
+MONITOR_INTERVAL = 2.0
+BUSY_MONITOR_INTERVAL = 5.0
+
+# Disk usage barely moves between 2s ticks and statvfs costs far more than the
+# cpu/memory reads, so the monitoring thread refreshes it every
+# DISK_SAMPLE_EVERY ticks; every other caller reads the cached value, falling
+# back to a real read until the cache has been filled (the monitoring thread
+# does not run when the app is served through flask run or a WSGI server)
+DISK_SAMPLE_EVERY = 30
+_disk_cache = None
+
+def get_system_metrics(refresh_disk=False):
+    """Collect basic system metrics, re-reading disk usage if refresh_disk"""
+    global _disk_cache
+    
     try:
+        if refresh_disk or _disk_cache is None:
+            _disk_cache = psutil.disk_usage('/').percent
+        
         return {
-            'cpu_usage': psutil.cpu_percent(),
+            'cpu_usage': psutil.cpu_percent(interval=None),
             'memory_usage': psutil.virtual_memory().percent,
-            'disk_usage': psutil.disk_usage('/').percent,
+            'disk_usage': _disk_cache,
             'timestamp': time.time()
         }
     except Exception as e:
         logger.error(f"Error collecting metrics: {e}")
         return None
 
-def predict_failures(metrics_history):
-    """Basic ML-based failure prediction"""
-    if len(metrics_history) < 2:
-        return {'failure_probability': 0.0}
-        
-    try:
-        # Extract features for ML
-        features = [[m['cpu_usage'], m['memory_usage'], m['disk_usage']] 
-                   for m in metrics_history]
-        
-        # Fit and predict
-        anomaly_detector.fit(features)
-        scores = anomaly_detector.score_samples(features)
-        
-        # Convert scores to probability (higher score = more likely to fail)
-        latest_score = scores[-1]
-        probability = 1 - (latest_score - min(scores)) / (max(scores) - min(scores))
-        
-        return {'failure_probability': float(probability)}
-        
-    except Exception as e:
-        logger.error(f"Prediction error: {e}")
-        return {'failure_probability': 0.0}
-
 def auto_remediate(metrics):
     """Simple AI remediation based on thresholds"""
     global active_remediation
@@ -81,19 +82,23 @@ def auto_remediate(metrics):
 
 def background_monitoring():
     """Background thread for system monitoring"""
-    while True:
+    global _latest_prediction
+    
+    tick = 0
+    while not _stop.is_set():
+        interval = MONITOR_INTERVAL
         try:
-            # Collect current metrics
-            metrics = get_system_metrics()
+            # Collect current metrics; only this thread refreshes disk usage
+            metrics = get_system_metrics(refresh_disk=tick % DISK_SAMPLE_EVERY == 0)
+            tick += 1
             if metrics:
-                metrics_history.append(metrics)
+                if metrics['cpu_usage'] > 90:
+                    interval = BUSY_MONITOR_INTERVAL
                 
-                # Keep last 60 readings
-                if len(metrics_history) > 60:
-                    metrics_history.pop(0)
-                
-                # Get ML predictions
-                prediction = predict_failures(metrics_history)
+                # Get ML predictions (also records the metrics in history)
+                prediction = predictor.predict_failures(metrics)
+                with _pred_lock:
+                    _latest_prediction = prediction
                 
                 # Log status
                 logger.info(
@@ -107,11 +112,11 @@ def background_monitoring():
                 if prediction['failure_probability'] > 0.8:
                     auto_remediate(metrics)
                     
-            time.sleep(2)
+            _stop.wait(interval)
             
         except Exception as e:
             logger.error(f"Monitoring error: {e}")
-            time.sleep(5)
+            _stop.wait(5)
 
 @app.route('/')
 def home():
@@ -125,13 +130,19 @@ def get_metrics():
         if not current_metrics:
             return jsonify({'error': 'Failed to collect metrics'}), 500
             
-        prediction = predict_failures(metrics_history)
+        # Model inference stays on the monitoring thread
+        with _pred_lock:
+            prediction = _latest_prediction
         
-        return jsonify({
-            'metrics': current_metrics,
-            'prediction': prediction,
-            'remediation_active': active_remediation
-        })
+        # Polled by the dashboard, so encode with orjson rather than jsonify
+        return Response(
+            orjson.dumps({
+                'metrics': current_metrics,
+                'prediction': prediction,
+                'remediation_active': active_remediation
+            }),
+            mimetype='application/json'
+        )
         
     except Exception as e:
         logger.error(f"API error: {e}")
@@ -153,7 +164,18 @@ if __name__ == '__main__':
         
         # Start Flask server
         logger.info("Starting server... Access dashboard at http://localhost:5000")
-        app.run(debug=True, host='0.0.0.0', port=5000)
+        # Debugger is opt-in; the reloader stays off either way since it
+        # forks a second process with its own monitoring thread and state
+        app.run(
+            debug=os.environ.get('FLASK_DEBUG') == '1',
+            host='0.0.0.0',
+            port=5000,
+            use_reloader=False,
+            threaded=True
+        )
         
     except Exception as e:
         logger.error(f"Server error: {e}")
+    finally:
+        # Wake the monitoring loop so it exits with the server
+        _stop.set()